@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import argparse
 import logging
+import sys
 
 from contextlib import suppress
 from importlib import import_module
@@ -10,90 +11,114 @@ from typing import TYPE_CHECKING
 from typing import cast
 
 from cleo.application import Application as BaseApplication
-from cleo.events.console_command_event import ConsoleCommandEvent
-from cleo.events.console_events import COMMAND
-from cleo.events.event_dispatcher import EventDispatcher
-from cleo.exceptions import CleoCommandNotFoundError
 from cleo.exceptions import CleoError
-from cleo.formatters.style import Style
 from cleo.io.inputs.argv_input import ArgvInput
 
 from poetry.__version__ import __version__
-from poetry.console.command_loader import CommandLoader
-from poetry.console.commands.command import Command
-from poetry.console.exceptions import PoetryRuntimeError
-from poetry.utils.helpers import directory
-from poetry.utils.helpers import ensure_path
 
 
 if TYPE_CHECKING:
     from collections.abc import Callable
 
     from cleo.events.event import Event
+    from cleo.events.event_dispatcher import EventDispatcher
     from cleo.io.inputs.definition import Definition
     from cleo.io.inputs.input import Input
     from cleo.io.io import IO
     from cleo.io.outputs.output import Output
 
+    from poetry.console.command_loader import CommandLoader
+    from poetry.console.commands.command import Command
     from poetry.console.commands.installer_command import InstallerCommand
     from poetry.poetry import Poetry
 
 
 def load_command(name: str) -> Callable[[], Command]:
+    module_path, class_name = _COMMAND_SPECS[name]
+    modules = sys.modules
+
     def _load() -> Command:
-        words = name.split(" ")
-        module = import_module("poetry.console.commands." + ".".join(words))
-        command_class = getattr(module, "".join(c.title() for c in words) + "Command")
-        command: Command = command_class()
+        # avoid going through the import machinery if the module is already loaded
+        module = modules.get(module_path)
+        if module is None:
+            module = import_module(module_path)
+        command: Command = getattr(module, class_name)()
         return command
 
     return _load
 
 
-COMMANDS = [
-    "about",
-    "add",
-    "build",
-    "check",
-    "config",
-    "init",
-    "install",
-    "lock",
-    "new",
-    "publish",
-    "remove",
-    "run",
-    "search",
-    "show",
-    "sync",
-    "update",
-    "version",
+# maps each command name to the module and class implementing it
+_COMMAND_SPECS: dict[str, tuple[str, str]] = {
+    "about": ("poetry.console.commands.about", "AboutCommand"),
+    "add": ("poetry.console.commands.add", "AddCommand"),
+    "build": ("poetry.console.commands.build", "BuildCommand"),
+    "check": ("poetry.console.commands.check", "CheckCommand"),
+    "config": ("poetry.console.commands.config", "ConfigCommand"),
+    "init": ("poetry.console.commands.init", "InitCommand"),
+    "install": ("poetry.console.commands.install", "InstallCommand"),
+    "lock": ("poetry.console.commands.lock", "LockCommand"),
+    "new": ("poetry.console.commands.new", "NewCommand"),
+    "publish": ("poetry.console.commands.publish", "PublishCommand"),
+    "remove": ("poetry.console.commands.remove", "RemoveCommand"),
+    "run": ("poetry.console.commands.run", "RunCommand"),
+    "search": ("poetry.console.commands.search", "SearchCommand"),
+    "show": ("poetry.console.commands.show", "ShowCommand"),
+    "sync": ("poetry.console.commands.sync", "SyncCommand"),
+    "update": ("poetry.console.commands.update", "UpdateCommand"),
+    "version": ("poetry.console.commands.version", "VersionCommand"),
     # Cache commands
-    "cache clear",
-    "cache list",
+    "cache clear": ("poetry.console.commands.cache.clear", "CacheClearCommand"),
+    "cache list": ("poetry.console.commands.cache.list", "CacheListCommand"),
     # Debug commands
-    "debug info",
-    "debug resolve",
+    "debug info": ("poetry.console.commands.debug.info", "DebugInfoCommand"),
+    "debug resolve": ("poetry.console.commands.debug.resolve", "DebugResolveCommand"),
     # Env commands
-    "env activate",
-    "env info",
-    "env list",
-    "env remove",
-    "env use",
+    "env activate": ("poetry.console.commands.env.activate", "EnvActivateCommand"),
+    "env info": ("poetry.console.commands.env.info", "EnvInfoCommand"),
+    "env list": ("poetry.console.commands.env.list", "EnvListCommand"),
+    "env remove": ("poetry.console.commands.env.remove", "EnvRemoveCommand"),
+    "env use": ("poetry.console.commands.env.use", "EnvUseCommand"),
     # Self commands
-    "self add",
-    "self install",
-    "self lock",
-    "self remove",
-    "self update",
-    "self show",
-    "self show plugins",
-    "self sync",
+    "self add": ("poetry.console.commands.self.add", "SelfAddCommand"),
+    "self install": ("poetry.console.commands.self.install", "SelfInstallCommand"),
+    "self lock": ("poetry.console.commands.self.lock", "SelfLockCommand"),
+    "self remove": ("poetry.console.commands.self.remove", "SelfRemoveCommand"),
+    "self update": ("poetry.console.commands.self.update", "SelfUpdateCommand"),
+    "self show": ("poetry.console.commands.self.show", "SelfShowCommand"),
+    "self show plugins": (
+        "poetry.console.commands.self.show.plugins",
+        "SelfShowPluginsCommand",
+    ),
+    "self sync": ("poetry.console.commands.self.sync", "SelfSyncCommand"),
     # Source commands
-    "source add",
-    "source remove",
-    "source show",
-]
+    "source add": ("poetry.console.commands.source.add", "SourceAddCommand"),
+    "source remove": ("poetry.console.commands.source.remove", "SourceRemoveCommand"),
+    "source show": ("poetry.console.commands.source.show", "SourceShowCommand"),
+}
+
+COMMANDS = list(_COMMAND_SPECS)
+
+
+# our own CLI styles as (name, foreground, options)
+_CLI_STYLES: tuple[tuple[str, str, tuple[str, ...]], ...] = (
+    ("c1", "cyan", ()),
+    ("c2", "default", ("bold",)),
+    ("info", "blue", ()),
+    ("comment", "green", ()),
+    ("warning", "yellow", ()),
+    ("debug", "default", ("dark",)),
+    ("success", "green", ()),
+    # Dark variants
+    ("c1_dark", "cyan", ("dark",)),
+    ("c2_dark", "default", ("bold", "dark")),
+    ("success_dark", "green", ("dark",)),
+)
+
+# commands for which loading plugins is skipped to speed up startup; they only
+# report information about Poetry itself, so listeners registered by application
+# plugins will not fire for them
+PLUGINLESS_COMMANDS = frozenset({"about"})
 
 # these are special messages to override the default message when a command is not found
 # in cases where a previously existing command has been moved to a plugin or outright
@@ -124,9 +149,14 @@ class Application(BaseApplication):
         self._disable_plugins = False
         self._disable_cache = False
         self._plugins_loaded = False
-        self._working_directory = Path.cwd()
+        self._working_directory: Path | None = None
         self._project_directory: Path | None = None
 
+        from cleo.events.console_events import COMMAND
+        from cleo.events.event_dispatcher import EventDispatcher
+
+        from poetry.console.command_loader import CommandLoader
+
         dispatcher = EventDispatcher()
         dispatcher.add_listener(COMMAND, self.register_command_loggers)
         dispatcher.add_listener(COMMAND, self.configure_env)
@@ -179,17 +209,24 @@ class Application(BaseApplication):
 
         return definition
 
+    @property
+    def working_directory(self) -> Path:
+        if self._working_directory is None:
+            self._working_directory = Path.cwd()
+
+        return self._working_directory
+
     @property
     def project_directory(self) -> Path:
-        return self._project_directory or self._working_directory
+        return self._project_directory or self.working_directory
 
     @property
     def poetry(self) -> Poetry:
-        from poetry.factory import Factory
-
         if self._poetry is not None:
             return self._poetry
 
+        from poetry.factory import Factory
+
         self._poetry = Factory().create_poetry(
             cwd=self.project_directory,
             io=self._io,
@@ -201,9 +238,7 @@ class Application(BaseApplication):
 
     @property
     def command_loader(self) -> CommandLoader:
-        command_loader = self._command_loader
-        assert isinstance(command_loader, CommandLoader)
-        return command_loader
+        return cast("CommandLoader", self._command_loader)
 
     def reset_poetry(self) -> None:
         self._poetry = None
@@ -214,22 +249,14 @@ class Application(BaseApplication):
         output: Output | None = None,
         error_output: Output | None = None,
     ) -> IO:
+        from cleo.formatters.style import Style
+
         io = super().create_io(input, output, error_output)
 
-        # Set our own CLI styles
+        # Set our own CLI styles, styles are mutable so each IO gets its own
         formatter = io.output.formatter
-        formatter.set_style("c1", Style("cyan"))
-        formatter.set_style("c2", Style("default", options=["bold"]))
-        formatter.set_style("info", Style("blue"))
-        formatter.set_style("comment", Style("green"))
-        formatter.set_style("warning", Style("yellow"))
-        formatter.set_style("debug", Style("default", options=["dark"]))
-        formatter.set_style("success", Style("green"))
-
-        # Dark variants
-        formatter.set_style("c1_dark", Style("cyan", options=["dark"]))
-        formatter.set_style("c2_dark", Style("default", options=["bold", "dark"]))
-        formatter.set_style("success_dark", Style("green", options=["dark"]))
+        for name, foreground, options in _CLI_STYLES:
+            formatter.set_style(name, Style(foreground, options=list(options)))
 
         io.output.set_formatter(formatter)
         io.error_output.set_formatter(formatter)
@@ -239,17 +266,23 @@ class Application(BaseApplication):
         return io
 
     def _run(self, io: IO) -> int:
+        from cleo.exceptions import CleoCommandNotFoundError
+
+        from poetry.console.exceptions import PoetryRuntimeError
+        from poetry.utils.helpers import directory
+
         # we do this here and not inside the _configure_io implementation in order
         # to ensure the users are not exposed to a stack trace for providing invalid values to
         # the options --directory or --project, configuring the options here allow cleo to trap and
         # display the error cleanly unless the user uses verbose or debug
         self._configure_global_options(io)
 
-        self._load_plugins(io)
+        if not self._can_skip_plugins(io):
+            self._load_plugins()
 
         exit_code: int = 1
 
-        with directory(self._working_directory):
+        with directory(self.working_directory):
             try:
                 exit_code = super()._run(io)
             except PoetryRuntimeError as e:
@@ -282,6 +315,8 @@ class Application(BaseApplication):
         :param io: The IO instance whose input and options are being read.
         :return: Nothing.
         """
+        from poetry.utils.helpers import ensure_path
+
         self._sort_global_options(io)
 
         self._disable_plugins = io.input.option("no-plugins")
@@ -327,30 +362,37 @@ class Application(BaseApplication):
         original_input = cast(ArgvInput, io.input)
         tokens: list[str] = original_input._tokens
 
-        parser = argparse.ArgumentParser(add_help=False)
+        # without any options there is nothing to sort; the input is still
+        # recreated below so that both cases are configured the same way
+        if any(token.startswith("-") for token in tokens):
+            options = self.definition.options
+            parser = argparse.ArgumentParser(add_help=False)
+            add_argument = parser.add_argument
 
-        for option in self.definition.options:
-            parser.add_argument(
-                f"--{option.name}",
-                *([f"-{option.shortcut}"] if option.shortcut else []),
-                action="store_true" if option.is_flag() else "store",
-            )
+            for option in options:
+                add_argument(
+                    f"--{option.name}",
+                    *([f"-{option.shortcut}"] if option.shortcut else []),
+                    action="store_true" if option.is_flag() else "store",
+                )
+
+            args, remaining_args = parser.parse_known_args(tokens)
 
-        args, remaining_args = parser.parse_known_args(tokens)
+            tokens = []
+            for option in options:
+                key = option.name.replace("-", "_")
+                value = getattr(args, key, None)
 
-        tokens = []
-        for option in self.definition.options:
-            key = option.name.replace("-", "_")
-            value = getattr(args, key, None)
+                if value is not None:
+                    if value:  # is truthy
+                        tokens.append(f"--{option.name}")
 
-            if value is not None:
-                if value:  # is truthy
-                    tokens.append(f"--{option.name}")
+                    if option.accepts_value():
+                        tokens.append(str(value))
 
-                if option.accepts_value():
-                    tokens.append(str(value))
+            tokens.extend(remaining_args)
 
-        sorted_input = ArgvInput([self._name or "", *tokens, *remaining_args])
+        sorted_input = ArgvInput([self._name or "", *tokens])
         sorted_input.set_stream(original_input.stream)
 
         with suppress(CleoError):
@@ -455,6 +497,9 @@ class Application(BaseApplication):
     def register_command_loggers(
         self, event: Event, event_name: str, _: EventDispatcher
     ) -> None:
+        from cleo.events.console_command_event import ConsoleCommandEvent
+
+        from poetry.console.commands.command import Command
         from poetry.console.logging.filters import POETRY_FILTER
         from poetry.console.logging.io_formatter import IOFormatter
         from poetry.console.logging.io_handler import IOHandler
@@ -474,9 +519,6 @@ class Application(BaseApplication):
 
         loggers += command.loggers
 
-        handler = IOHandler(io)
-        handler.setFormatter(IOFormatter())
-
         level = logging.WARNING
 
         if io.is_debug():
@@ -484,11 +526,17 @@ class Application(BaseApplication):
         elif io.is_very_verbose() or io.is_verbose():
             level = logging.INFO
 
-        logging.basicConfig(level=level, handlers=[handler])
+        # basicConfig() does nothing once the root logger has handlers,
+        # so only set up our handler if it is actually going to be used
+        if not logging.getLogger().handlers:
+            handler = IOHandler(io)
+            handler.setFormatter(IOFormatter())
+
+            # only log third-party packages when very verbose
+            if not io.is_very_verbose():
+                handler.addFilter(POETRY_FILTER)
 
-        # only log third-party packages when very verbose
-        if not io.is_very_verbose():
-            handler.addFilter(POETRY_FILTER)
+            logging.basicConfig(level=level, handlers=[handler])
 
         for name in loggers:
             logger = logging.getLogger(name)
@@ -505,6 +553,8 @@ class Application(BaseApplication):
             logger.setLevel(_level)
 
     def configure_env(self, event: Event, event_name: str, _: EventDispatcher) -> None:
+        from cleo.events.console_command_event import ConsoleCommandEvent
+
         from poetry.console.commands.env_command import EnvCommand
         from poetry.console.commands.self.self_command import SelfCommand
 
@@ -533,6 +583,8 @@ class Application(BaseApplication):
     def configure_installer_for_event(
         cls, event: Event, event_name: str, _: EventDispatcher
     ) -> None:
+        from cleo.events.console_command_event import ConsoleCommandEvent
+
         from poetry.console.commands.installer_command import InstallerCommand
 
         assert isinstance(event, ConsoleCommandEvent)
@@ -563,12 +615,17 @@ class Application(BaseApplication):
         )
         command.set_installer(installer)
 
-    def _load_plugins(self, io: IO) -> None:
+    def _can_skip_plugins(self, io: IO) -> bool:
+        # cleo only prints the version and exits when --version is passed
+        if io.input.has_parameter_option(["--version", "-V"], True):
+            return True
+
+        return self._get_command_name(io) in PLUGINLESS_COMMANDS
+
+    def _load_plugins(self) -> None:
         if self._plugins_loaded:
             return
 
-        self._disable_plugins = io.input.has_parameter_option("--no-plugins")
-
         if not self._disable_plugins:
             from poetry.plugins.application_plugin import ApplicationPlugin
             from poetry.plugins.plugin_manager import PluginManager
@@ -20,8 +20,6 @@ from poetry.config.config import Config
 from poetry.exceptions import PoetryError
 from poetry.json import validate_object
 from poetry.packages.locker import Locker
-from poetry.plugins.plugin import Plugin
-from poetry.plugins.plugin_manager import PluginManager
 from poetry.poetry import Poetry
 from poetry.toml.file import TOMLFile
 
@@ -112,6 +110,10 @@ class Factory(BaseFactory):
         )
 
         if not disable_plugins:
+            # the plugin manager pulls in the installer and environment machinery
+            from poetry.plugins.plugin import Plugin
+            from poetry.plugins.plugin_manager import PluginManager
+
             plugin_manager = PluginManager(Plugin.group)
             plugin_manager.load_plugins()
             plugin_manager.activate(poetry, io)
@@ -3,14 +3,8 @@ from __future__ import annotations
 import locale
 import sys
 
-from contextlib import suppress
-
-
-if sys.version_info < (3, 11):
-    # compatibility for python <3.11
-    import tomli as tomllib
-else:
-    import tomllib
+from importlib import import_module
+from typing import TYPE_CHECKING
 
 
 if sys.version_info < (3, 10):
@@ -19,40 +13,69 @@ if sys.version_info < (3, 10):
 else:
     from importlib import metadata
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from types import ModuleType
+
+    # at runtime tomllib is provided lazily by __getattr__, hence the noqa
+    if sys.version_info < (3, 11):
+        import tomli as tomllib
+    else:
+        import tomllib  # noqa: TCH004
+
+
+# compatibility for python <3.11
+_TOMLLIB = "tomli" if sys.version_info < (3, 11) else "tomllib"
+
 WINDOWS = sys.platform == "win32"
 
+_DEFAULT_ENCODINGS = ("utf-8", "latin1", "ascii")
+
 
-def decode(string: bytes | str, encodings: list[str] | None = None) -> str:
+def decode(string: bytes | str, encodings: Sequence[str] | None = None) -> str:
     if not isinstance(string, bytes):
         return string
 
-    encodings = encodings or ["utf-8", "latin1", "ascii"]
+    encodings = encodings or _DEFAULT_ENCODINGS
 
     for encoding in encodings:
-        with suppress(UnicodeEncodeError, UnicodeDecodeError):
+        try:
             return string.decode(encoding)
+        except (UnicodeEncodeError, UnicodeDecodeError):
+            continue
 
     return string.decode(encodings[0], errors="ignore")
 
 
-def encode(string: str, encodings: list[str] | None = None) -> bytes:
+def encode(string: str, encodings: Sequence[str] | None = None) -> bytes:
     if isinstance(string, bytes):
         return string
 
-    encodings = encodings or ["utf-8", "latin1", "ascii"]
+    encodings = encodings or _DEFAULT_ENCODINGS
 
     for encoding in encodings:
-        with suppress(UnicodeEncodeError, UnicodeDecodeError):
+        try:
             return string.encode(encoding)
+        except (UnicodeEncodeError, UnicodeDecodeError):
+            continue
 
     return string.encode(encodings[0], errors="ignore")
 
 
-def getencoding() -> str:
-    if sys.version_info < (3, 11):
-        return locale.getpreferredencoding()
-    else:
-        return locale.getencoding()
+if sys.version_info < (3, 11):
+    getencoding = locale.getpreferredencoding
+else:
+    getencoding = locale.getencoding
+
+
+def __getattr__(name: str) -> ModuleType:
+    # tomllib is only imported on first access
+    if name != "tomllib":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = import_module(_TOMLLIB)
+    globals()[name] = module
+    return module
 
 
 __all__ = [
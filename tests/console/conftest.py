@@ -97,8 +97,7 @@ def poetry(
 @pytest.fixture
 def app(poetry: Poetry) -> PoetryTestApplication:
     app_ = PoetryTestApplication(poetry)
-    io = NullIO()
-    app_._load_plugins(io)
+    app_._load_plugins()
     return app_
 
 
@@ -3,6 +3,7 @@ from __future__ import annotations
 import re
 import shutil
 
+from io import StringIO
 from typing import TYPE_CHECKING
 from typing import ClassVar
 from typing import cast
@@ -14,6 +15,7 @@ from cleo.testers.application_tester import ApplicationTester
 from poetry.console.application import Application
 from poetry.console.commands.command import Command
 from poetry.plugins.application_plugin import ApplicationPlugin
+from poetry.plugins.plugin_manager import PluginManager
 from poetry.plugins.plugin_manager import ProjectPluginCache
 from poetry.repositories.cached_repository import CachedRepository
 from poetry.utils.authenticator import Authenticator
@@ -96,6 +98,20 @@ def test_application_execute_plugin_command_with_plugins_disabled(
     assert tester.status_code == 1
 
 
+@pytest.mark.parametrize("command", ["about", "--version", "foo --version"])
+def test_application_skips_plugins_if_not_needed(
+    command: str, with_add_command_plugin: None, mocker: MockerFixture
+) -> None:
+    load_plugins = mocker.spy(PluginManager, "load_plugins")
+    app = Application()
+
+    tester = ApplicationTester(app)
+    tester.execute(command)
+
+    assert tester.status_code == 0
+    load_plugins.assert_not_called()
+
+
 @pytest.mark.parametrize("with_project_plugins", [False, True])
 @pytest.mark.parametrize("no_plugins", [False, True])
 def test_application_project_plugins(
@@ -193,6 +209,10 @@ def test_application_verify_cache_flag_at_install(
 @pytest.mark.parametrize(
     ("tokens", "result"),
     [
+        (
+            ["env", "list"],
+            ["env", "list"],
+        ),
         (
             ["-C", "/path/working/dir", "env", "list"],
             ["--directory", "/path/working/dir", "env", "list"],
@@ -245,3 +265,23 @@ def test_application_input_configuration_and_sorting(
 
     io_input = cast("ArgvInput", app._io.input)
     assert io_input._tokens == result
+
+
+@pytest.mark.parametrize("tokens", [["about"], ["--no-cache", "about"]])
+def test_application_sorting_keeps_interactivity_independent_of_options(
+    tokens: list[str], app: PoetryTestApplication
+) -> None:
+    app.create_io()
+    assert app._io is not None
+
+    io_input = cast("ArgvInput", app._io.input)
+    io_input._tokens = tokens
+    io_input.set_stream(StringIO())
+
+    app._configure_io(app._io)
+    app._sort_global_options(app._io)
+
+    # the input is recreated whether options were given or not,
+    # so piped input is handled the same way in both cases
+    assert app._io.input is not io_input
+    assert app._io.is_interactive()